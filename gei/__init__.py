@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+"""
+Herramienta de cuantificación de emisiones GEI para sistemas de agua potable y saneamiento.
+Uso: python -m gei {serve,calc,inventario,report}. Los submódulos se cargan bajo demanda;
+importar el paquete no genera archivos, no abre puertos ni lanza el navegador.
+"""
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+Punto de entrada: python -m gei {serve,calc,inventario,report}.
+Solo se importan los módulos que necesita el subcomando elegido; el tiempo de
+arranque (hasta tener cargados los módulos del subcomando) se mide con --tiempo
+y se compara con OBJETIVO_ARRANQUE_MS (verificado en tests/test_arranque.py).
+"""
+import time
+
+_INICIO = time.perf_counter()
+
+import argparse
+import sys
+
+from gei.datos import GWP, BASE_GWP
+from gei.reportes import REPORTES
+
+# Presupuesto de arranque por subcomando (ms); inventario incluye la importación de NumPy.
+OBJETIVO_ARRANQUE_MS = {"serve": 100, "calc": 100, "report": 100, "inventario": 250}
+
+
+def _arranque(args):
+    """Informa el tiempo transcurrido hasta cargar los módulos del subcomando."""
+    ms = (time.perf_counter() - _INICIO) * 1000
+    if args.tiempo:
+        objetivo = OBJETIVO_ARRANQUE_MS[args.comando]
+        estado = "OK" if ms <= objetivo else "⚠️ supera el objetivo"
+        print(f"⏱️ Arranque: {ms:.1f} ms (objetivo {objetivo} ms) {estado}", file=sys.stderr)
+    return ms
+
+
+def cmd_serve(args):
+    from gei.servidor import servir
+
+    _arranque(args)
+    return servir(args.reporte, args.puerto, abrir_navegador=not args.no_navegador)
+
+
+def cmd_calc(args):
+    from gei.calculadora import calcular
+
+    _arranque(args)
+    try:
+        resultado = calcular(args.proyecto, base=args.gwp)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    if args.json:
+        import json
+
+        print(json.dumps(resultado, ensure_ascii=False, indent=2))
+        return 0
+    print(f"PROYECTO: {resultado['proyecto'].upper()} (base {resultado['base']})")
+    for r in resultado["rubros"]:
+        print(f"  {r['nombre']:<24} {r['cantidad']:>14.2f} {r['unit']:<5} × {r['fe']:<8.6g} = {r['emision']:>10.2f} tCO₂e")
+    print(f"  {'Huella Total Estimada':<24} {resultado['total']:>45.2f} tCO₂e")
+    print("  Por gas: " + " | ".join(f"{gas}: {t:.4f} t" for gas, t in resultado["por_gas"].items()))
+    return 0
+
+
+def cmd_inventario(args):
+    try:
+        from gei.inventario import inventario
+    except ImportError:
+        print("❌ El inventario multigás requiere NumPy (pip install numpy).", file=sys.stderr)
+        return 1
+
+    _arranque(args)
+    inv = inventario(bases=args.gwp)
+    print(f"{'Proyecto':<12}" + "".join(f"{b:>14}" for b in inv["bases"]) + "   (tCO₂e)")
+    for i, proyecto in enumerate(inv["proyectos"]):
+        print(f"{proyecto:<12}" + "".join(f"{v:>14.2f}" for v in inv["co2e"][i]))
+    print(f"{'Total':<12}" + "".join(f"{v:>14.2f}" for v in inv["co2e"].sum(axis=0)))
+    print(f"\n{'Proyecto':<12}" + "".join(f"{g:>14}" for g in inv["gases"]) + "   (t de gas)")
+    for i, proyecto in enumerate(inv["proyectos"]):
+        print(f"{proyecto:<12}" + "".join(f"{v:>14.4f}" for v in inv["por_gas"][i]))
+    return 0
+
+
+def cmd_report(args):
+    from gei.reportes import escribir
+
+    _arranque(args)
+    print(f"✅ Reporte generado: {escribir(args.reporte, args.salida)}")
+    return 0
+
+
+def crear_parser():
+    parser = argparse.ArgumentParser(prog="python -m gei", description="Herramienta de cuantificación GEI")
+    parser.add_argument("--tiempo", action="store_true", help="Mostrar el tiempo de arranque")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    p = sub.add_parser("serve", help="Generar el reporte e iniciar el servidor local")
+    p.add_argument("reporte", nargs="?", choices=REPORTES, default="calculadora")
+    p.add_argument("--puerto", type=int, default=None)
+    p.add_argument("--no-navegador", action="store_true", help="No abrir el navegador")
+    p.set_defaults(func=cmd_serve)
+
+    p = sub.add_parser("calc", help="Calcular emisiones por rubro de un proyecto")
+    p.add_argument("proyecto")
+    p.add_argument("--gwp", choices=GWP, default=BASE_GWP, help="Base GWP para tCO₂e")
+    p.add_argument("--json", action="store_true")
+    p.set_defaults(func=cmd_calc)
+
+    p = sub.add_parser("inventario", help="Inventario multigás del portafolio por base GWP (requiere NumPy)")
+    p.add_argument("--gwp", choices=GWP, nargs="+", default=None, help="Bases GWP (por defecto todas)")
+    p.set_defaults(func=cmd_inventario)
+
+    p = sub.add_parser("report", help="Generar el HTML del reporte sin servirlo")
+    p.add_argument("reporte", nargs="?", choices=REPORTES, default="calculadora")
+    p.add_argument("-o", "--salida", default=None)
+    p.set_defaults(func=cmd_report)
+    return parser
+
+
+def main(argv=None):
+    args = crear_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
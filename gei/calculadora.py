@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Cálculo de emisiones GEI por rubro (cantidad APU × factor de emisión por gas).
+Módulo sin efectos secundarios: puede importarse desde procesos de trabajo.
+Para el portafolio completo y varias bases GWP a la vez ver gei.inventario.
+"""
+from gei.datos import FACTORES, APU_INICIALES, FACTORES_GAS, GASES, GWP, BASE_GWP
+
+
+def factor_co2e(key, base=BASE_GWP):
+    """Factor de emisión agregado (tCO₂e/u) de un rubro según la base GWP."""
+    gwp = GWP[base]
+    return sum(f * gwp[gas] for gas, f in FACTORES_GAS[key].items())
+
+
+def calcular(proyecto, apu=None, base=BASE_GWP):
+    """
+    Emisiones por rubro de un proyecto, por gas (t) y en tCO₂e según `base`.
+    `apu` sobrescribe las cantidades iniciales (mismas claves que APU_INICIALES).
+    Retorna {"proyecto", "base", "rubros": [{nombre, key, unit, cantidad, fe, gases, emision}],
+    "por_gas", "total"}.
+    """
+    if proyecto not in FACTORES:
+        raise ValueError(f"Proyecto desconocido: {proyecto!r} (opciones: {', '.join(FACTORES)})")
+    if base not in GWP:
+        raise ValueError(f"Base GWP desconocida: {base!r} (opciones: {', '.join(GWP)})")
+    cantidades = dict(APU_INICIALES.get(proyecto, {}))
+    cantidades.update(apu or {})
+
+    rubros = []
+    por_gas = dict.fromkeys(GASES, 0.0)
+    for nombre, data in FACTORES[proyecto].items():
+        cantidad = float(cantidades.get(data["key"], 0) or 0)
+        gases = {gas: cantidad * f for gas, f in FACTORES_GAS[data["key"]].items()}
+        for gas, t in gases.items():
+            por_gas[gas] += t
+        fe = factor_co2e(data["key"], base)
+        rubros.append({
+            "nombre": nombre,
+            "key": data["key"],
+            "unit": data["unit"],
+            "cantidad": cantidad,
+            "fe": fe,
+            "gases": gases,
+            "emision": cantidad * fe,
+        })
+    return {
+        "proyecto": proyecto,
+        "base": base,
+        "rubros": rubros,
+        "por_gas": por_gas,
+        "total": sum(r["emision"] for r in rubros),
+    }
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+Base de datos integrada: factores de emisión y APU por proyecto (Calculadora GEI)
+y métricas de costo social del carbono (Reporte V2).
+Solo datos: importar este módulo no tiene efectos secundarios.
+"""
+
+# --- GASES Y POTENCIALES DE CALENTAMIENTO GLOBAL ---
+# El CH₄ se separa en fósil y biogénico porque AR6 les asigna GWP distintos.
+GASES = ("CO2", "CH4_fosil", "CH4_biogenico", "N2O")
+
+# Base -> GWP por gas. IPCC AR5 (sin retroalimentación) y AR6 (Tabla 7.15).
+GWP = {
+    "AR5-GWP100": {"CO2": 1, "CH4_fosil": 28, "CH4_biogenico": 28, "N2O": 265},
+    "AR5-GWP20": {"CO2": 1, "CH4_fosil": 84, "CH4_biogenico": 84, "N2O": 264},
+    "AR6-GWP100": {"CO2": 1, "CH4_fosil": 29.8, "CH4_biogenico": 27.0, "N2O": 273},
+    "AR6-GWP20": {"CO2": 1, "CH4_fosil": 82.5, "CH4_biogenico": 79.7, "N2O": 273},
+}
+BASE_GWP = "AR5-GWP100"
+
+# Clave APU -> factor de emisión por gas (t de gas / unidad).
+# Los materiales provienen de factores de ciclo de vida ya agregados y se asignan a CO2.
+# Combustión de diésel y tratamiento biológico se desagregan de modo que con
+# AR5-GWP100 reproducen los factores tCO₂e originales (0.00267, 0.00012 y 0.0003).
+FACTORES_GAS = {
+    "hormigon_mortero": {"CO2": 0.40},
+    "pvc_tuberia": {"CO2": 3.10},
+    "acero_refuerzo": {"CO2": 1.85},
+    "asfalto": {"CO2": 0.08},
+    "quimicos_operacion": {"CO2": 1.00},
+    "diesel_obra": {"CO2": 0.00265102, "CH4_fosil": 1.1e-7, "N2O": 6.0e-8},
+    "diesel_respaldo": {"CO2": 0.00265102, "CH4_fosil": 1.1e-7, "N2O": 6.0e-8},
+    "transporte_excavado": {"CO2": 0.0001188, "CH4_fosil": 5.0e-9, "N2O": 4.0e-9},
+    "tratamiento_biologico": {"CH4_biogenico": 9.2e-6, "N2O": 1.6e-7},
+}
+
+# --- CONFIGURACIÓN DE DATOS (Calculadora GEI) ---
+# Rubro -> unidad, clave APU (factores en FACTORES_GAS) y color del gráfico.
+FACTORES = {
+    "logroño": {
+        "Hormigón y Mortero": {"unit": "m³", "key": "hormigon_mortero", "color": "#10b981"},
+        "Tubería PVC": {"unit": "t", "key": "pvc_tuberia", "color": "#3b82f6"},
+        "Acero de Refuerzo": {"unit": "t", "key": "acero_refuerzo", "color": "#6366f1"},
+        "Diésel (Maquinaria)": {"unit": "L", "key": "diesel_obra", "color": "#f59e0b"},
+        "Diésel (Generador)": {"unit": "L", "key": "diesel_respaldo", "color": "#f97316"},
+        "Transporte Excavado": {"unit": "t·km", "key": "transporte_excavado", "color": "#ef4444"},
+    },
+    "rumiñahui": {
+        "Hormigón y Mortero": {"unit": "m³", "key": "hormigon_mortero", "color": "#10b981"},
+        "Tubería PVC": {"unit": "t", "key": "pvc_tuberia", "color": "#3b82f6"},
+        "Acero Refuerzo": {"unit": "t", "key": "acero_refuerzo", "color": "#6366f1"},
+        "Mezcla Asfáltica": {"unit": "t", "key": "asfalto", "color": "#1f2937"},
+        "Diésel Maquinaria": {"unit": "L", "key": "diesel_obra", "color": "#f59e0b"},
+        "Insumos Químicos": {"unit": "t", "key": "quimicos_operacion", "color": "#06b6d4"},
+    },
+    "mera": {
+        "Hormigón": {"unit": "m³", "key": "hormigon_mortero", "color": "#10b981"},
+        "Tubería PVC": {"unit": "t", "key": "pvc_tuberia", "color": "#3b82f6"},
+        "Acero Refuerzo": {"unit": "t", "key": "acero_refuerzo", "color": "#6366f1"},
+        "Diésel Maquinaria": {"unit": "L", "key": "diesel_obra", "color": "#f59e0b"},
+        "Diésel Generador": {"unit": "L", "key": "diesel_respaldo", "color": "#f97316"},
+        "Transp. Excavado": {"unit": "t·km", "key": "transporte_excavado", "color": "#ef4444"},
+        "Trat. Biológico": {"unit": "m³", "key": "tratamiento_biologico", "color": "#8b5cf6"},
+    },
+}
+
+APU_INICIALES = {
+    "logroño": {"hormigon_mortero": 333.73, "pvc_tuberia": 233.96, "acero_refuerzo": 10.63, "diesel_obra": 22085.20, "diesel_respaldo": 2000, "transporte_excavado": 249228},
+    "rumiñahui": {"hormigon_mortero": 2111.18, "pvc_tuberia": 133.13, "acero_refuerzo": 84.28, "asfalto": 1111.87, "diesel_obra": 39218.36, "quimicos_operacion": 5.45},
+    "mera": {"hormigon_mortero": 1665.24, "pvc_tuberia": 179.59, "acero_refuerzo": 104.25, "diesel_obra": 54121.12, "diesel_respaldo": 2000, "transporte_excavado": 219546.83, "tratamiento_biologico": 746985},
+}
+
+# --- COSTO SOCIAL DEL CARBONO (Reporte V2) ---
+# Metodología: Burke et al. (2023) + Fernandez et al. (2015).
+PROYECTOS_SCC = {
+    "rumiñahui": {
+        "id": "rumiñahui",
+        "title": "Sistema AP Rumiñahui",
+        "location": "Sierra (Pichincha)",
+        "emissions": 1589.98, # tCO2e Construcción
+        # Fernandez 2015: Baja sensibilidad, Alta capacidad adaptativa
+        "vuln_metrics": {"exp": 0.85, "sens": 0.20, "ac": 0.80},
+        "sc_scenarios": {
+            "conservative": 17.00, # 5% Discount (Burke)
+            "central": 51.00,      # 3% Discount (Burke)
+            "ethical": 85.00       # 2.5% Discount (Burke)
+        }
+    },
+    "logroño": {
+        "id": "logroño",
+        "title": "Agua Potable Logroño",
+        "location": "Amazonía (M. Santiago)",
+        "emissions": 946.03, # tCO2e Construcción
+        # Fernandez 2015: Alta vulnerabilidad amazónica
+        "vuln_metrics": {"exp": 0.75, "sens": 0.85, "ac": 0.30},
+        "sc_scenarios": {
+            # Ajuste por vulnerabilidad (+20% sobre base Burke para Amazonía)
+            "conservative": 45.00,
+            "central": 85.00,
+            "ethical": 120.00
+        }
+    },
+    "mera": {
+        "id": "mera",
+        "title": "Alcantarillado Mera",
+        "location": "Amazonía (Pastaza)",
+        "emissions": 1586.55, # tCO2e Construcción
+        # Fernandez 2015: Alta sensibilidad y exposición
+        "vuln_metrics": {"exp": 0.80, "sens": 0.75, "ac": 0.40},
+        "sc_scenarios": {
+            # Ajuste por vulnerabilidad (+20% sobre base Burke para Amazonía)
+            "conservative": 45.00,
+            "central": 85.00,
+            "ethical": 120.00
+        }
+    }
+}
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+Historial de auditoría de ediciones APU (cantidades y factores de emisión por gas).
+Registro append-only por proyecto: cada versión guarda solo el delta y cada
+INTERVALO_SNAPSHOT versiones se agrega el estado completo (snapshot), de modo
+que cualquier versión se reconstruye con una búsqueda O(log n) y a lo sumo
+INTERVALO_SNAPSHOT - 1 deltas, sin reproducir toda la historia.
+Los factores se registran por gas: la base GWP es una elección de reporte, no
+una edición, y se aplica recién al comparar emisiones (diff_emisiones).
+"""
+import bisect
+import json
+import math
+import os
+import re
+from datetime import datetime, timezone
+
+from gei.datos import GASES, GWP, BASE_GWP
+
+INTERVALO_SNAPSHOT = 32
+DIRECTORIO = "historial"
+SECCIONES = ("apu", "gases")  # apu: cantidades, gases: factores por gas (t/u)
+
+_NOMBRE_VALIDO = re.compile(r"[\w-]+")
+
+
+def _estado_vacio():
+    return {seccion: {} for seccion in SECCIONES}
+
+
+def _ahora():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _aplicar(estado, delta):
+    """Aplica un delta sobre el estado (None elimina la clave)."""
+    for seccion, cambios in delta.items():
+        destino = estado.setdefault(seccion, {})
+        for clave, valor in cambios.items():
+            if valor is None:
+                destino.pop(clave, None)
+            else:
+                destino[clave] = valor
+    return estado
+
+
+def _es_numero(valor):
+    return not isinstance(valor, bool) and isinstance(valor, (int, float)) and math.isfinite(valor)
+
+
+def _validar(seccion, valores):
+    """Solo se registran números finitos (o None para eliminar una clave); en `gases`, objetos gas -> número."""
+    if valores is None:
+        return
+    if not isinstance(valores, dict):
+        raise ValueError(f"'{seccion}' debe ser un objeto clave -> valor")
+    for clave, valor in valores.items():
+        if valor is None:
+            continue
+        if seccion != "gases":
+            if not _es_numero(valor):
+                raise ValueError(f"Valor no numérico en '{seccion}.{clave}': {valor!r}")
+            continue
+        if not isinstance(valor, dict):
+            raise ValueError(f"'gases.{clave}' debe ser un objeto gas -> factor")
+        for gas, f in valor.items():
+            if gas not in GASES:
+                raise ValueError(f"Gas desconocido en 'gases.{clave}': {gas!r} (opciones: {', '.join(GASES)})")
+            if not _es_numero(f):
+                raise ValueError(f"Valor no numérico en 'gases.{clave}.{gas}': {f!r}")
+
+
+def _calcular_delta(anterior, nuevo):
+    delta = {}
+    for seccion in SECCIONES:
+        viejo = anterior.get(seccion, {})
+        actual = nuevo.get(seccion)
+        if actual is None:  # Sección no enviada: sin cambios
+            continue
+        cambios = {k: v for k, v in actual.items() if viejo.get(k) != v}
+        cambios.update({k: None for k in viejo if k not in actual})
+        if cambios:
+            delta[seccion] = cambios
+    return delta
+
+
+def _factor_co2e(estado, clave, base):
+    """FE (tCO₂e/u) de un rubro: factores por gas ponderados por los GWP de la base."""
+    gwp = GWP[base]
+    return sum(f * gwp[gas] for gas, f in estado["gases"].get(clave, {}).items())
+
+
+class HistorialAPU:
+    """
+    Log de cambios de un proyecto en `<directorio>/<proyecto>.jsonl`.
+    Cada línea: {"v": versión, "t": fecha ISO UTC, "d": delta} y, si
+    v % INTERVALO_SNAPSHOT == 0, además "s": estado completo.
+    En memoria solo se mantienen los offsets de cada línea y sus fechas.
+    """
+
+    def __init__(self, proyecto, directorio=DIRECTORIO):
+        os.makedirs(directorio, exist_ok=True)
+        self.ruta = self.ruta_de(proyecto, directorio)
+        self._offsets = []  # _offsets[v - 1] = posición en bytes de la versión v
+        self._fechas = []
+        self._estado = _estado_vacio()
+        self._cargar()
+
+    @staticmethod
+    def ruta_de(proyecto, directorio=DIRECTORIO):
+        if not _NOMBRE_VALIDO.fullmatch(proyecto):
+            raise ValueError(f"Nombre de proyecto inválido: {proyecto!r}")
+        return os.path.join(directorio, f"{proyecto}.jsonl")
+
+    @classmethod
+    def existe(cls, proyecto, directorio=DIRECTORIO):
+        return os.path.exists(cls.ruta_de(proyecto, directorio))
+
+    def _cargar(self):
+        if not os.path.exists(self.ruta):
+            return
+        with open(self.ruta, "rb") as f:
+            pos = 0
+            for linea in f:
+                if linea.strip():
+                    try:
+                        if not linea.endswith(b"\n"):
+                            raise ValueError("línea incompleta")
+                        entrada = json.loads(linea)
+                    except ValueError:
+                        # Solo la última línea puede quedar cortada (escritura interrumpida)
+                        if f.read(1):
+                            raise
+                        break
+                    self._offsets.append(pos)
+                    self._fechas.append(entrada["t"])
+                    if "s" in entrada:
+                        self._estado = entrada["s"]
+                    else:
+                        _aplicar(self._estado, entrada["d"])
+                pos += len(linea)
+        if pos < os.path.getsize(self.ruta):
+            with open(self.ruta, "r+b") as f:
+                f.truncate(pos)
+
+    @property
+    def version(self):
+        return len(self._offsets)
+
+    def registrar(self, apu=None, gases=None):
+        """Agrega una versión si hay cambios respecto al estado actual. Retorna la versión vigente."""
+        nuevo = {"apu": apu, "gases": gases}
+        for seccion, valores in nuevo.items():
+            _validar(seccion, valores)
+        delta = _calcular_delta(self._estado, nuevo)
+        if not delta:
+            return self.version
+        # El estado en memoria solo cambia cuando la línea quedó escrita en disco
+        estado = _aplicar(json.loads(json.dumps(self._estado)), delta)
+        v = self.version + 1
+        entrada = {"v": v, "t": _ahora(), "d": delta}
+        if v % INTERVALO_SNAPSHOT == 0:
+            entrada["s"] = estado
+        linea = (json.dumps(entrada, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+        with open(self.ruta, "ab") as f:
+            pos = f.seek(0, os.SEEK_END)
+            try:
+                f.write(linea)
+                f.flush()
+            except OSError:
+                f.truncate(pos)  # No dejar una línea a medias delante de la próxima versión
+                raise
+        self._estado = estado
+        self._offsets.append(pos)
+        self._fechas.append(entrada["t"])
+        return v
+
+    def _leer(self, f, v):
+        f.seek(self._offsets[v - 1])
+        return json.loads(f.readline())
+
+    def estado(self, version=None):
+        """Reconstruye el estado de una versión partiendo del snapshot más cercano."""
+        if version is None:
+            version = self.version
+        if not 0 <= version <= self.version:
+            raise ValueError(f"Versión fuera de rango: {version} (actual {self.version})")
+        if version == 0:
+            return _estado_vacio()
+        base = version - version % INTERVALO_SNAPSHOT
+        with open(self.ruta, "rb") as f:
+            estado = self._leer(f, base)["s"] if base else _estado_vacio()
+            estado = json.loads(json.dumps(estado))  # Copia independiente
+            for v in range(base + 1, version + 1):
+                _aplicar(estado, self._leer(f, v)["d"])
+        return estado
+
+    def version_en(self, fecha):
+        """Última versión registrada en o antes de `fecha` (ISO UTC), por búsqueda binaria."""
+        return bisect.bisect_right(self._fechas, fecha)
+
+    def diff_emisiones(self, version_a, version_b, base=BASE_GWP):
+        """Emisiones (cantidad × FE según la base GWP) por rubro en dos versiones y su diferencia."""
+        if base not in GWP:
+            raise ValueError(f"Base GWP desconocida: {base!r} (opciones: {', '.join(GWP)})")
+        ea, eb = self.estado(version_a), self.estado(version_b)
+        rubros = {}
+        for clave in sorted(set(ea["apu"]) | set(eb["apu"])):
+            a = ea["apu"].get(clave, 0) * _factor_co2e(ea, clave, base)
+            b = eb["apu"].get(clave, 0) * _factor_co2e(eb, clave, base)
+            rubros[clave] = {"a": a, "b": b, "delta": b - a}
+        total_a = sum(r["a"] for r in rubros.values())
+        total_b = sum(r["b"] for r in rubros.values())
+        return {
+            "version_a": version_a,
+            "version_b": version_b,
+            "base": base,
+            "rubros": rubros,
+            "total": {"a": total_a, "b": total_b, "delta": total_b - total_a},
+        }
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Inventario multigás del portafolio completo con agregación vectorizada (NumPy).
+Las emisiones se obtienen como productos matriciales:
+    Q (proyectos × rubros) @ F (rubros × gases) = E (proyectos × gases)
+    E @ W (gases × bases GWP) = tCO₂e (proyectos × bases)
+de modo que cambiar o agregar bases GWP re-pondera todos los proyectos en una sola pasada.
+NumPy se importa solo con este módulo; gei.calculadora no lo requiere.
+"""
+import numpy as np
+
+from gei.datos import FACTORES, APU_INICIALES, FACTORES_GAS, GASES, GWP
+
+
+def matriz_factores(rubros=None):
+    """Matriz F (rubros × gases) en t de gas por unidad."""
+    rubros = list(rubros or FACTORES_GAS)
+    F = np.zeros((len(rubros), len(GASES)))
+    for i, key in enumerate(rubros):
+        for j, gas in enumerate(GASES):
+            F[i, j] = FACTORES_GAS[key].get(gas, 0.0)
+    return rubros, F
+
+
+def matriz_gwp(bases=None):
+    """Matriz W (gases × bases) con los GWP de cada base."""
+    bases = list(bases or GWP)
+    desconocidas = [b for b in bases if b not in GWP]
+    if desconocidas:
+        raise ValueError(f"Base GWP desconocida: {', '.join(desconocidas)} (opciones: {', '.join(GWP)})")
+    W = np.array([[GWP[b][gas] for b in bases] for gas in GASES], dtype=float)
+    return bases, W
+
+
+def matriz_cantidades(rubros, apus=None):
+    """Matriz Q (proyectos × rubros); `apus` sobrescribe cantidades por proyecto."""
+    proyectos = list(FACTORES)
+    columna = {key: j for j, key in enumerate(rubros)}
+    Q = np.zeros((len(proyectos), len(rubros)))
+    for i, proyecto in enumerate(proyectos):
+        cantidades = dict(APU_INICIALES.get(proyecto, {}))
+        cantidades.update((apus or {}).get(proyecto, {}))
+        for data in FACTORES[proyecto].values():
+            Q[i, columna[data["key"]]] = float(cantidades.get(data["key"], 0) or 0)
+    return proyectos, Q
+
+
+def inventario(apus=None, bases=None):
+    """
+    Inventario del portafolio en una pasada vectorizada.
+    Retorna {"proyectos", "rubros", "gases", "bases",
+             "por_gas" (P×G, t), "co2e" (P×B, tCO₂e), "por_rubro" (P×R×B, tCO₂e)}.
+    """
+    rubros, F = matriz_factores()
+    bases, W = matriz_gwp(bases)
+    proyectos, Q = matriz_cantidades(rubros, apus)
+    por_gas = Q @ F
+    return {
+        "proyectos": proyectos,
+        "rubros": rubros,
+        "gases": list(GASES),
+        "bases": bases,
+        "por_gas": por_gas,
+        "co2e": por_gas @ W,
+        "por_rubro": Q[:, :, None] * (F @ W)[None, :, :],
+    }
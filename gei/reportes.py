@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+Generación de los reportes HTML (Calculadora GEI y Costo Social V2).
+Las plantillas se leen del paquete solo cuando se solicita un reporte.
+"""
+import json
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _plantilla(nombre):
+    from importlib import resources  # Costosa de importar: solo al generar un reporte
+
+    return resources.files("gei").joinpath("plantillas", nombre).read_text(encoding="utf-8")
+
+
+def _json(datos):
+    return json.dumps(datos, ensure_ascii=False)
+
+
+def render_calculadora():
+    """HTML de la calculadora GEI con gráficos y modo reporte."""
+    from gei.datos import FACTORES, APU_INICIALES, FACTORES_GAS, GWP, BASE_GWP
+
+    factores = {
+        proyecto: {nombre: {**data, "gases": FACTORES_GAS[data["key"]]} for nombre, data in rubros.items()}
+        for proyecto, rubros in FACTORES.items()
+    }
+    return (_plantilla("calculadora.html")
+            .replace("__FACTORES__", _json(factores))
+            .replace("__APU_INICIALES__", _json(APU_INICIALES))
+            .replace("__GWP__", _json(GWP))
+            .replace("__BASE_GWP__", _json(BASE_GWP)))
+
+
+def render_costo_social():
+    """HTML del reporte de costo social del carbono (Burke + Fernandez)."""
+    from gei.datos import PROYECTOS_SCC
+
+    return _plantilla("costo_social.html").replace("__PROYECTOS__", json.dumps(PROYECTOS_SCC))
+
+
+# Reporte -> (función de render, archivo de salida, puerto por defecto)
+REPORTES = {
+    "calculadora": (render_calculadora, "index.html", 8000),
+    "costo-social": (render_costo_social, "social_cost_v2.html", 8003),
+}
+
+
+def escribir(reporte, salida=None):
+    """Genera el HTML del reporte y lo guarda en disco. Retorna la ruta escrita."""
+    render, archivo, _ = REPORTES[reporte]
+    salida = salida or archivo
+    with open(salida, "w", encoding="utf-8") as f:
+        f.write(render())
+    return salida
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+Servidor web local para los reportes y la API de historial de auditoría.
+Nada se escribe ni se enlaza a un puerto hasta llamar a `servir()`.
+"""
+import http.server
+import json
+import socketserver
+import webbrowser
+from urllib.parse import urlsplit, parse_qs, unquote
+
+from gei.datos import BASE_GWP
+from gei.historial import HistorialAPU
+
+# --- API de Historial de Auditoría ---
+# POST /api/historial/<proyecto>            {"apu": {...}, "gases": {...}} -> registra versión
+# GET  /api/historial/<proyecto>?version=N   (o ?fecha=ISO) -> estado reconstruido
+# GET  /api/historial/<proyecto>/diff?a=N&b=M[&gwp=BASE] -> diferencia de emisiones entre versiones
+API_HISTORIAL = "/api/historial/"
+historiales = {}
+
+
+def obtener_historial(proyecto, crear=False):
+    """Historial en caché; sin `crear`, un proyecto sin archivo de log lanza LookupError."""
+    if proyecto not in historiales:
+        if not crear and not HistorialAPU.existe(proyecto):
+            raise LookupError(f"Proyecto sin historial: {proyecto!r}")
+        historiales[proyecto] = HistorialAPU(proyecto)
+    return historiales[proyecto]
+
+
+class Handler(http.server.SimpleHTTPRequestHandler):
+
+    def _responder_json(self, datos, status=200):
+        cuerpo = json.dumps(datos, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(cuerpo)))
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def _ruta_historial(self):
+        url = urlsplit(self.path)
+        if not url.path.startswith(API_HISTORIAL):
+            return None
+        partes = unquote(url.path[len(API_HISTORIAL):]).strip("/").split("/")
+        params = {k: v[0] for k, v in parse_qs(url.query).items()}
+        return partes, params
+
+    def do_GET(self):
+        ruta = self._ruta_historial()
+        if ruta is None:
+            return super().do_GET()
+        partes, params = ruta
+        try:
+            historial = obtener_historial(partes[0])
+            if partes[1:] == ["diff"]:
+                datos = historial.diff_emisiones(int(params["a"]), int(params["b"]), params.get("gwp", BASE_GWP))
+            elif len(partes) == 1:
+                if "fecha" in params:
+                    version = historial.version_en(params["fecha"])
+                else:
+                    version = int(params.get("version", historial.version))
+                datos = {"version": version, "estado": historial.estado(version)}
+            else:
+                return self._responder_json({"error": "Ruta no encontrada"}, 404)
+        except KeyError as e:
+            return self._responder_json({"error": f"Falta el parámetro {e}"}, 400)
+        except LookupError as e:
+            return self._responder_json({"error": str(e)}, 404)
+        except ValueError as e:
+            return self._responder_json({"error": str(e)}, 400)
+        self._responder_json(datos)
+
+    def do_POST(self):
+        ruta = self._ruta_historial()
+        if ruta is None or len(ruta[0]) != 1:
+            return self._responder_json({"error": "Ruta no encontrada"}, 404)
+        try:
+            largo = int(self.headers.get("Content-Length", 0))
+            datos = json.loads(self.rfile.read(largo) or b"{}")
+            version = obtener_historial(ruta[0][0], crear=True).registrar(datos.get("apu"), datos.get("gases"))
+        except (ValueError, AttributeError) as e:
+            return self._responder_json({"error": str(e)}, 400)
+        self._responder_json({"version": version})
+
+
+def servir(reporte="calculadora", puerto=None, abrir_navegador=True):
+    """Genera el HTML del reporte, inicia el servidor y (opcionalmente) abre el navegador."""
+    from gei import reportes
+
+    _, _, puerto_defecto = reportes.REPORTES[reporte]
+    puerto = puerto if puerto is not None else puerto_defecto
+    try:
+        archivo = reportes.escribir(reporte)
+        print(f"✅ Archivo '{archivo}' generado.")
+    except IOError as e:
+        print(f"❌ Error al escribir: {e}")
+        return 1
+
+    try:
+        with socketserver.TCPServer(("", puerto), Handler) as httpd:
+            url = f"http://localhost:{httpd.server_address[1]}/{archivo}"  # Puerto real si se pidió 0
+            print("\n" + "="*60)
+            print(f"🚀 SERVIDOR GEI ACTIVO ({reporte})")
+            print(f"👉 Abre aquí: {url}")
+            print("Ctrl+C para salir.")
+            print("="*60 + "\n")
+            if abrir_navegador:
+                webbrowser.open_new_tab(url)
+            httpd.serve_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 Servidor detenido.")
+    except OSError as e:
+        print(f"\n⚠️ Error: {e}")
+        return 1
+    return 0
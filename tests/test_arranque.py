@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from gei.__main__ import OBJETIVO_ARRANQUE_MS
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENTORNO = {**os.environ, "PYTHONPATH": RAIZ, "PYTHONDONTWRITEBYTECODE": "1"}
+
+# Importa los módulos con red, navegador y escritura de archivos vigilados.
+SCRIPT_IMPORTACION = """
+import builtins, io, os, socket, webbrowser
+llamadas = []
+def vigilar(nombre):
+    def f(*a, **k):
+        llamadas.append(nombre)
+        raise AssertionError(nombre)
+    return f
+socket.socket.bind = vigilar("bind")
+socket.socket.connect = vigilar("connect")
+webbrowser.open = webbrowser.open_new_tab = vigilar("navegador")
+os.makedirs = os.mkdir = vigilar("mkdir")
+_open = builtins.open
+def abrir(archivo, mode="r", *a, **k):
+    if any(c in mode for c in "wax+"):
+        llamadas.append(("open", archivo))
+    return _open(archivo, mode, *a, **k)
+builtins.open = io.open = abrir
+import gei, gei.datos, gei.calculadora, gei.historial, gei.reportes, gei.servidor, gei.__main__
+try:
+    import numpy
+except ImportError:
+    pass
+else:
+    import gei.inventario
+print(llamadas)
+"""
+
+
+def _medir_arranque(argv, cwd):
+    """
+    Mínimo de 3 ejecuciones del tiempo de reloj (ms) desde lanzar el proceso hasta
+    la línea de --tiempo: incluye el intérprete y `gei/__init__.py`, no solo lo que
+    el proceso mide de sí mismo.
+    """
+    tiempos = []
+    for _ in range(3):
+        inicio = time.perf_counter()
+        proc = subprocess.Popen([sys.executable, "-m", "gei", "--tiempo", *argv], cwd=cwd, env=ENTORNO,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, encoding="utf-8")
+        try:
+            linea = proc.stderr.readline()
+            tiempos.append((time.perf_counter() - inicio) * 1000)
+        finally:
+            proc.kill()
+            proc.wait()
+        assert "Arranque" in linea, linea
+    return min(tiempos)
+
+
+def test_importar_no_tiene_efectos_secundarios(tmp_path):
+    salida = subprocess.run([sys.executable, "-c", SCRIPT_IMPORTACION], cwd=tmp_path, env=ENTORNO,
+                            capture_output=True, text=True, check=True).stdout
+    assert salida.strip() == "[]"
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.parametrize("argv", [
+    ["calc", "mera"],
+    ["report", "-o", "reporte.html"],
+    ["serve", "--puerto", "0", "--no-navegador"],
+    ["inventario"],
+])
+def test_arranque_dentro_del_objetivo(tmp_path, argv):
+    if argv[0] == "inventario":
+        pytest.importorskip("numpy")
+    assert _medir_arranque(argv, tmp_path) <= OBJETIVO_ARRANQUE_MS[argv[0]]
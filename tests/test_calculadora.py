@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from gei.calculadora import calcular
+from gei.datos import APU_INICIALES
+
+# Factores tCO₂e de la calculadora original (run_server.py antes del paquete gei).
+FE_ORIGINAL = {
+    "hormigon_mortero": 0.40, "pvc_tuberia": 3.10, "acero_refuerzo": 1.85, "asfalto": 0.08,
+    "diesel_obra": 0.00267, "diesel_respaldo": 0.00267, "transporte_excavado": 0.00012,
+    "quimicos_operacion": 1.00, "tratamiento_biologico": 0.0003,
+}
+
+
+@pytest.mark.parametrize("proyecto", list(APU_INICIALES))
+def test_reproduce_totales_originales(proyecto):
+    esperado = sum(c * FE_ORIGINAL[k] for k, c in APU_INICIALES[proyecto].items())
+    resultado = calcular(proyecto)
+    assert resultado["total"] == pytest.approx(esperado, rel=1e-9)
+    for r in resultado["rubros"]:
+        assert r["emision"] == pytest.approx(r["cantidad"] * FE_ORIGINAL[r["key"]], rel=1e-9)
+
+
+def test_totales_de_referencia():
+    assert round(calcular("logroño")["total"], 2) == 972.65
+    assert round(calcular("rumiñahui")["total"], 2) == 1612.21
+    assert round(calcular("mera")["total"], 2) == 1815.97
+
+
+def test_apu_sobrescribe_cantidades():
+    assert calcular("mera", {"hormigon_mortero": 0})["total"] == pytest.approx(1815.97 - 666.096, abs=0.01)
+
+
+def test_proyecto_desconocido():
+    with pytest.raises(ValueError):
+        calcular("quito")
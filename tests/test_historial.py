@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from gei.historial import HistorialAPU, INTERVALO_SNAPSHOT
+
+GASES = {"a": {"CO2": 0.5}, "b": {"CO2": 2.0}}
+DIESEL = {"CO2": 0.00265102, "CH4_fosil": 1.1e-7, "N2O": 6.0e-8}
+
+
+def _llenar(historial, n):
+    """Registra n versiones; la versión v tiene apu = {"a": v, "b": v % 3}."""
+    for v in range(1, n + 1):
+        assert historial.registrar({"a": v, "b": v % 3}, GASES) == v
+
+
+@pytest.fixture
+def historial(tmp_path):
+    return HistorialAPU("logroño", directorio=str(tmp_path))
+
+
+@pytest.mark.parametrize("version", [1, 31, 32, 33, 64])
+def test_reconstruye_versiones_alrededor_de_snapshots(historial, version):
+    assert INTERVALO_SNAPSHOT == 32
+    _llenar(historial, 70)
+    assert historial.estado(version) == {"apu": {"a": version, "b": version % 3}, "gases": GASES}
+
+
+def test_version_cero_y_fuera_de_rango(historial):
+    _llenar(historial, 3)
+    assert historial.estado(0) == {"apu": {}, "gases": {}}
+    with pytest.raises(ValueError):
+        historial.estado(4)
+
+
+def test_sin_cambios_no_crea_version(historial):
+    _llenar(historial, 2)
+    assert historial.registrar({"a": 2, "b": 2}, GASES) == 2
+    assert historial.registrar({"a": 2, "b": 2}) == 2
+
+
+def test_recarga_desde_disco(historial, tmp_path):
+    _llenar(historial, 65)
+    recargado = HistorialAPU("logroño", directorio=str(tmp_path))
+    assert recargado.version == 65
+    for v in (31, 32, 33, 64, 65):
+        assert recargado.estado(v) == historial.estado(v)
+    assert recargado.registrar({"a": 100}) == 66
+
+
+def test_eliminacion_con_none(historial):
+    historial.registrar({"a": 1, "b": 2}, GASES)
+    historial.registrar({"a": 1}, GASES)  # "b" ya no se envía
+    historial.registrar({"a": 1, "c": 3})
+    assert historial.estado(2)["apu"] == {"a": 1}
+    assert historial.estado(3)["apu"] == {"a": 1, "c": 3}
+    assert historial.estado(1)["apu"] == {"a": 1, "b": 2}
+
+
+def test_version_en(historial):
+    _llenar(historial, 3)
+    historial._fechas[:] = ["2024-01-01T00:00:00Z", "2025-01-01T00:00:00Z", "2026-01-01T00:00:00Z"]
+    assert historial.version_en("2023-12-31T00:00:00Z") == 0
+    assert historial.version_en("2025-01-01T00:00:00Z") == 2
+    assert historial.version_en("2025-06-01T00:00:00Z") == 2
+    assert historial.version_en("2099-01-01T00:00:00Z") == 3
+
+
+def test_diff_emisiones(historial):
+    historial.registrar({"a": 10}, {"a": {"CO2": 2.0}})
+    historial.registrar({"a": 15})
+    diff = historial.diff_emisiones(1, 2)
+    assert diff["rubros"]["a"] == {"a": 20.0, "b": 30.0, "delta": 10.0}
+    assert diff["total"]["delta"] == 10.0
+
+
+def test_diff_emisiones_segun_base_gwp(historial):
+    historial.registrar({"diesel_obra": 1000}, {"diesel_obra": DIESEL})
+    historial.registrar({"diesel_obra": 2000})
+    ar5 = historial.diff_emisiones(1, 2)
+    ar6_20 = historial.diff_emisiones(1, 2, "AR6-GWP20")
+    assert ar5["base"] == "AR5-GWP100"
+    assert ar5["total"]["delta"] == pytest.approx(2.67)
+    assert ar6_20["total"]["delta"] == pytest.approx(1000 * (0.00265102 + 1.1e-7 * 82.5 + 6.0e-8 * 273))
+    with pytest.raises(ValueError):
+        historial.diff_emisiones(1, 2, "AR4")
+
+
+def test_cambiar_base_gwp_no_crea_version(historial):
+    # La calculadora reenvía los mismos factores por gas sea cual sea la base elegida.
+    historial.registrar({"diesel_obra": 1000}, {"diesel_obra": DIESEL})
+    assert historial.registrar({"diesel_obra": 1000}, {"diesel_obra": dict(DIESEL)}) == 1
+
+
+@pytest.mark.parametrize("apu", [{"a": "x"}, {"a": True}, {"a": float("nan")}, ["a"]])
+def test_rechaza_valores_no_numericos(historial, apu):
+    with pytest.raises(ValueError):
+        historial.registrar(apu)
+    assert historial.version == 0
+
+
+@pytest.mark.parametrize("gases", [{"a": 0.5}, {"a": {"CO2": "x"}}, {"a": {"SF6": 1.0}}])
+def test_rechaza_factores_por_gas_invalidos(historial, gases):
+    with pytest.raises(ValueError):
+        historial.registrar({"a": 1}, gases)
+    assert historial.version == 0
+
+
+@pytest.mark.parametrize("nombre", ["abc\n", "../x", "", "a/b"])
+def test_rechaza_nombres_invalidos(tmp_path, nombre):
+    with pytest.raises(ValueError):
+        HistorialAPU(nombre, directorio=str(tmp_path))
+
+
+def test_tolera_ultima_linea_truncada(historial, tmp_path):
+    _llenar(historial, 3)
+    with open(historial.ruta, "ab") as f:
+        f.write(b'{"v":4,"t":"2026-01-')
+    recargado = HistorialAPU("logroño", directorio=str(tmp_path))
+    assert recargado.version == 3
+    assert recargado.registrar({"a": 9}) == 4
+    assert HistorialAPU("logroño", directorio=str(tmp_path)).estado(4)["apu"] == {"a": 9}
+
+
+def test_escritura_fallida_no_altera_el_estado(historial, monkeypatch):
+    _llenar(historial, 2)
+
+    def falla(*a, **k):
+        raise OSError("disco lleno")
+
+    monkeypatch.setattr("builtins.open", falla)
+    with pytest.raises(OSError):
+        historial.registrar({"a": 50, "b": 2})
+    monkeypatch.undo()
+    assert historial.version == 2
+    assert historial.registrar({"a": 50, "b": 2}) == 3
+    assert historial.estado(3)["apu"] == {"a": 50, "b": 2}
+    assert historial.estado(2)["apu"] == {"a": 2, "b": 2}
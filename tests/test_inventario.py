@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from gei.calculadora import calcular
+from gei.datos import GASES, GWP
+from gei.inventario import inventario
+
+
+@pytest.fixture(scope="module")
+def inv():
+    return inventario()
+
+
+def test_co2e_coincide_con_calcular_por_proyecto_y_base(inv):
+    assert inv["bases"] == list(GWP)
+    for i, proyecto in enumerate(inv["proyectos"]):
+        for j, base in enumerate(inv["bases"]):
+            assert inv["co2e"][i, j] == pytest.approx(calcular(proyecto, base=base)["total"], rel=1e-12)
+
+
+def test_por_gas_coincide_con_calcular(inv):
+    assert inv["gases"] == list(GASES)
+    for i, proyecto in enumerate(inv["proyectos"]):
+        por_gas = calcular(proyecto)["por_gas"]
+        assert inv["por_gas"][i] == pytest.approx([por_gas[g] for g in GASES], rel=1e-12, abs=1e-12)
+
+
+def test_por_rubro_suma_co2e(inv):
+    assert inv["por_rubro"].shape == (len(inv["proyectos"]), len(inv["rubros"]), len(inv["bases"]))
+    np.testing.assert_allclose(inv["por_rubro"].sum(axis=1), inv["co2e"], rtol=1e-12)
+
+
+def test_subconjunto_de_bases():
+    parcial = inventario(bases=["AR6-GWP20"])
+    completo = inventario()
+    assert parcial["bases"] == ["AR6-GWP20"]
+    np.testing.assert_allclose(parcial["co2e"][:, 0], completo["co2e"][:, completo["bases"].index("AR6-GWP20")])
+
+
+def test_base_desconocida():
+    with pytest.raises(ValueError):
+        inventario(bases=["AR4-GWP100"])
+
+
+def test_apus_sobrescriben_cantidades(inv):
+    apus = {"mera": {"tratamiento_biologico": 0, "hormigon_mortero": 2000}}
+    modificado = inventario(apus=apus)
+    i = modificado["proyectos"].index("mera")
+    for j, base in enumerate(modificado["bases"]):
+        assert modificado["co2e"][i, j] == pytest.approx(calcular("mera", apus["mera"], base)["total"], rel=1e-12)
+    assert modificado["por_gas"][i, GASES.index("CH4_biogenico")] == 0
+    # Los demás proyectos no cambian
+    otros = [k for k, p in enumerate(modificado["proyectos"]) if p != "mera"]
+    np.testing.assert_array_equal(modificado["co2e"][otros], inv["co2e"][otros])